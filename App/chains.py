@@ -1,86 +1,124 @@
 import streamlit as st
-from langchain_community.document_loaders import WebBaseLoader
-from gemini_client import GeminiClient
-from utils import clean_text
-
-def create_streamlit_app(llm, clean_text):
+import resources
+from content_extractor import load_page_text
+from export import export_batch
+from job_store import JobStore
+from near_duplicates import PostingCache
+from ranking import rank_jobs
+from utils import clean_text, split_postings
+
+def create_streamlit_app(llm, clean_text, store=None, cache=None):
     st.title("📧 Cold Mail & Cover Letter Generator")
-    url_input = st.text_input("Enter a Job Posting URL:", value="")
-
-    # Upload Resume File
-    resume_file = st.file_uploader("Upload Your Resume", type=["pdf", "docx", "txt"])
-
-    # Dropdown to choose content type
-    content_type = st.selectbox("Select Content Type", ["Cold Email", "Cover Letter"])
-
-    submit_button = st.button("Generate Content")
-
-    if submit_button:
-        try:
-            # 1) Load and clean web content
-            loader = WebBaseLoader([url_input])
-            raw_text = loader.load().pop().page_content
-            data = clean_text(raw_text[:6000])  # limit text for safety
-
-            # 2) Parse resume if provided
-            if resume_file is not None:
-                if resume_file.type == "application/pdf":
-                    resume_content = extract_pdf_text(resume_file)
-                elif resume_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    resume_content = extract_docx_text(resume_file)
-                elif resume_file.type == "text/plain":
-                    resume_content = str(resume_file.read(), "utf-8")
+    store = store or JobStore()
+    cache = cache or PostingCache()
+
+    generate_tab, search_tab = st.tabs(["✍️ Generate", "🗂️ Saved Jobs"])
+    with search_tab:
+        render_job_search(store)
+
+    with generate_tab:
+        url_input = st.text_input("Enter a Job Posting URL:", value="")
+
+        # Upload Resume File
+        resume_file = st.file_uploader("Upload Your Resume", type=["pdf", "docx", "txt"])
+
+        # Dropdown to choose content type
+        content_type = st.selectbox("Select Content Type", ["Cold Email", "Cover Letter"])
+
+        # Only the best matching jobs get content generated (ranked against the resume)
+        top_k = st.number_input("Generate for top matching jobs", min_value=1, max_value=50, value=3)
+
+        submit_button = st.button("Generate Content")
+
+        if submit_button:
+            try:
+                # 1) Load web content and split it into posting-aligned chunks
+                raw_text = load_page_text(url_input)
+                chunks = [clean_text(chunk) for chunk in split_postings(raw_text, max_chars=6000)]
+
+                # 2) Parse resume if provided
+                if resume_file is not None:
+                    if resume_file.type == "application/pdf":
+                        resume_content = extract_pdf_text(resume_file)
+                    elif resume_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                        resume_content = extract_docx_text(resume_file)
+                    elif resume_file.type == "text/plain":
+                        resume_content = str(resume_file.read(), "utf-8")
+                    else:
+                        st.error("Unsupported resume format")
+                        return
                 else:
-                    st.error("Unsupported resume format")
-                    return
-            else:
-                resume_content = ""
+                    resume_content = ""
 
-            # 3) Extract jobs
-            jobs = llm.extract_jobs(data)
+                # 3) Extract jobs chunk by chunk (merged and deduplicated)
+                jobs = llm.extract_jobs_chunked(chunks)
+                store.upsert_jobs(url_input, jobs)
 
-            with st.expander("🔍 View Extracted Jobs (Raw JSON)"):
-                st.json(jobs)
+                with st.expander("🔍 View Extracted Jobs (Raw JSON)"):
+                    st.json(jobs)
 
-            # Handle no jobs
-            if not jobs or (isinstance(jobs, list) and len(jobs) == 0):
-                st.warning("No job postings extracted. Try a different URL.")
-                return
+                # Handle no jobs
+                if not jobs:
+                    st.warning("No job postings extracted. Try a different URL.")
+                    return
 
-            # Flatten if nested
-            flat_jobs = []
-            for job_item in jobs:
-                if isinstance(job_item, list):
-                    flat_jobs.extend(job_item)
+                # Rank jobs against the resume and keep the top-k
+                if resume_content:
+                    ranked = rank_jobs(resume_content, jobs, top_k=int(top_k))
+                    st.markdown("### 🎯 Best Matching Jobs")
+                    st.table([
+                        {"Role": job.get("role", "N/A"), "Match": f"{score:.0%}"}
+                        for score, job in ranked
+                    ])
+                    jobs = [job for _, job in ranked]
                 else:
-                    flat_jobs.append(job_item)
-            jobs = flat_jobs
-
-            # 4) Generate Content
-            for job in jobs:
-                # For demonstration, let's do a direct “job_description”
-                job_description = job.get("description", "No description found")
-
-                if content_type == "Cold Email":
-                    content = llm.write_mail(job_description, "no links")
-                    st.code(content, language='markdown')
-
-                elif content_type == "Cover Letter":
-                    content = llm.write_cover_letter(resume_content, job_description, "no links")
-                    st.code(content, language='markdown')
-
-                    # (Optional) No docx saving? Or keep it:
-                    filename = llm.save_cover_letter(content)
-                    with open(filename, "rb") as file:
-                        st.download_button(
-                            label="Download Cover Letter",
-                            data=file,
-                            file_name=filename,
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                    jobs = jobs[:int(top_k)]
+
+                # 4) Generate Content
+                generated = []
+                for job in jobs:
+                    # For demonstration, let's do a direct “job_description”
+                    job_description = job.get("description") or "No description found"
+
+                    if content_type == "Cold Email":
+                        content = cache.get_or_compute(
+                            job_description, "", "cold_email",
+                            lambda: llm.write_mail(job_description, "no links")
                         )
+                        st.code(content, language='markdown')
 
-        except Exception as e:
-            st.error(f"An Error Occurred: {e}")
+                    elif content_type == "Cover Letter":
+                        content = cache.get_or_compute(
+                            job_description, resume_content, "cover_letter",
+                            lambda: llm.write_cover_letter(resume_content, job_description, "no links")
+                        )
+                        st.code(content, language='markdown')
+
+                    generated.append((job, content_type, content))
+
+                # 5) One download for the whole batch
+                if generated:
+                    st.download_button(
+                        label="📦 Download All (ZIP)",
+                        data=export_batch(generated, llm.render_cover_letter),
+                        file_name="applications.zip",
+                        mime="application/zip"
+                    )
+
+            except Exception as e:
+                st.error(f"An Error Occurred: {e}")
+
+# Saved Jobs tab: query stored postings without re-fetching or re-calling the model
+def render_job_search(store):
+    st.caption(f"{store.count()} postings saved from previous scrapes.")
+    keywords = st.text_input("Keywords", value="", key="job_search_keywords")
+    skill = st.text_input("Skill", value="", key="job_search_skill")
+
+    for job in store.search(keywords, skill):
+        with st.expander(f"{job['role'] or 'Untitled role'} · {job['experience'] or 'N/A'}"):
+            st.markdown(f"**Skills:** {', '.join(job['skills']) or 'N/A'}")
+            st.write(job["description"])
+            st.caption(job["url"])
 
 # Helper: Extract PDF text
 def extract_pdf_text(pdf_file):
@@ -101,6 +139,9 @@ def extract_docx_text(docx_file):
     return text
 
 if __name__ == "__main__":
-    chain = GeminiClient()  # from gemini_client.py
     st.set_page_config(layout="wide", page_title="Cold Email & Cover Letter Generator", page_icon="📧")
-    create_streamlit_app(chain, clean_text)
+    resources.warm_up()
+    create_streamlit_app(
+        resources.get_llm(), clean_text,
+        store=resources.get_job_store(), cache=resources.get_posting_cache()
+    )
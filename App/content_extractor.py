@@ -0,0 +1,161 @@
+import re
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ATS-Ninja/1.0)"}
+
+# Only the (thread-safe) connection pool is shared across reruns, sessions and
+# prefetch threads, so job boards reuse keep-alive connections
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=8)
+
+BOILERPLATE_TAGS = ["script", "style", "noscript", "template", "svg", "iframe", "button", "nav", "aside"]
+# Usually search/login boxes, but ASP.NET WebForms wraps the whole page in one <form>
+GUARDED_TAGS = ["form"]
+PAGE_CHROME_TAGS = ["header", "footer"]
+# Whole class/id/role tokens (split on "-", "_" and whitespace), so "lead-",
+# "thread-" or "upload-" never match. Bare "ad" is left out on purpose: job
+# boards call the posting itself a "job ad" (e.g. class="job-ad-body").
+BOILERPLATE_HINTS = {
+    "cookie", "cookies", "consent", "gdpr", "banner", "navbar", "nav", "menu", "breadcrumb", "breadcrumbs",
+    "footer", "sidebar", "related", "similar", "recommended", "recommendations", "share", "sharing",
+    "social", "newsletter", "subscribe", "modal", "popup", "promo", "ads", "advert", "advertisement", "sponsored",
+}
+# Never drop a guarded or hinted element holding more than this share of the page's text
+MAX_BOILERPLATE_SHARE = 0.5
+BLOCK_TAGS = ["p", "li", "pre", "td", "h1", "h2", "h3", "h4", "dd"]
+
+
+def fetch_html(url, timeout=15):
+    # A fresh Session per fetch, so cookies never carry over to another user's
+    # request; it is not closed because that would close the shared pool
+    session = requests.Session()
+    session.mount("https://", _adapter)
+    session.mount("http://", _adapter)
+    session.headers.update(HEADERS)
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def _html_to_text(fragment):
+    return BeautifulSoup(fragment, "html.parser").get_text("\n", strip=True)
+
+
+def _iter_jsonld(node):
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_jsonld(item)
+    elif isinstance(node, dict):
+        yield node
+        yield from _iter_jsonld(node.get("@graph", []))
+
+
+def extract_job_posting_jsonld(soup):
+    # Prefer the schema.org JobPosting the site publishes for search engines.
+    postings = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        for node in _iter_jsonld(data):
+            types = node.get("@type", [])
+            if "JobPosting" not in (types if isinstance(types, list) else [types]):
+                continue
+            parts = [node.get("title", "")]
+            organization = node.get("hiringOrganization")
+            if isinstance(organization, dict) and organization.get("name"):
+                parts.append(f"Company: {organization['name']}")
+            for key in ("employmentType", "experienceRequirements", "skills", "qualifications"):
+                value = node.get(key)
+                if isinstance(value, list):
+                    value = ", ".join(str(v) for v in value)
+                if isinstance(value, str) and value:
+                    parts.append(f"{key}: {_html_to_text(value)}")
+            parts.append(_html_to_text(node.get("description", "")))
+            postings.append("\n".join(p for p in parts if p))
+    return "\n\n".join(postings) or None
+
+
+def _strip_boilerplate(soup):
+    for tag in soup.find_all(BOILERPLATE_TAGS):
+        tag.decompose()
+    page_length = len((soup.body or soup).get_text(" ", strip=True)) or 1
+    for tag in soup.find_all(GUARDED_TAGS):
+        if not tag.decomposed and len(tag.get_text(" ", strip=True)) / page_length <= MAX_BOILERPLATE_SHARE:
+            tag.decompose()
+    for tag in soup.find_all(PAGE_CHROME_TAGS):
+        # Keep headers/footers that belong to the posting itself
+        if not tag.find_parent(["article", "main"]):
+            tag.decompose()
+    for tag in soup.find_all(True):
+        if tag.decomposed or tag.name in ("html", "body", "main", "article"):
+            continue
+        hints = " ".join(tag.get("class", [])) + " " + (tag.get("id") or "") + " " + (tag.get("role") or "")
+        if BOILERPLATE_HINTS.isdisjoint(re.split(r"[-_\s]+", hints.lower())):
+            continue
+        # A hinted element that carries most of the page is the content, not chrome
+        if len(tag.get_text(" ", strip=True)) / page_length > MAX_BOILERPLATE_SHARE:
+            continue
+        tag.decompose()
+
+
+def _link_density(tag):
+    text_length = len(tag.get_text(" ", strip=True)) or 1
+    link_length = sum(len(a.get_text(" ", strip=True)) for a in tag.find_all("a"))
+    return link_length / text_length
+
+
+def _best_candidate(soup):
+    # Readability-style scoring: text blocks vote for their parent (full score)
+    # and grandparent (half score); link-heavy containers are penalised.
+    # Keyed by id() because bs4 tags with identical markup compare/hash equal.
+    tags = {}
+    scores = {}
+    for block in soup.find_all(BLOCK_TAGS):
+        text = block.get_text(" ", strip=True)
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        for ancestor, weight in ((block.parent, 1), (block.parent and block.parent.parent, 0.5)):
+            if ancestor is None:
+                continue
+            tags[id(ancestor)] = ancestor
+            scores[id(ancestor)] = scores.get(id(ancestor), 0) + score * weight
+
+    if not scores:
+        return None
+    best = max(scores, key=lambda key: scores[key] * (1 - _link_density(tags[key])))
+    return tags[best]
+
+
+def extract_main_content(html, min_chars=200):
+    soup = BeautifulSoup(html, "html.parser")
+
+    posting = extract_job_posting_jsonld(soup)
+    if posting and len(posting) >= min_chars:
+        return posting
+
+    _strip_boilerplate(soup)
+    candidate = _best_candidate(soup)
+    text = candidate.get_text("\n", strip=True) if candidate is not None else ""
+    if len(text) < min_chars:
+        # Nothing convincing; fall back to everything that survived the cleanup
+        body = soup.body or soup
+        text = body.get_text("\n", strip=True)
+    if len(text) < min_chars:
+        # The cleanup itself removed the posting; use the original page's visible text
+        original = BeautifulSoup(html, "html.parser")
+        for tag in original.find_all(["script", "style", "noscript", "template"]):
+            tag.decompose()
+        text = (original.body or original).get_text("\n", strip=True)
+
+    # Blank line between blocks so utils.split_postings can find boundaries
+    return re.sub(r"\n", "\n\n", text)
+
+
+def load_page_text(url):
+    return extract_main_content(fetch_html(url))
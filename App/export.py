@@ -0,0 +1,41 @@
+import re
+import zipfile
+from io import BytesIO
+
+
+def slugify(text, max_length=40):
+    slug = re.sub(r"[^a-zA-Z0-9]+", "_", str(text or "")).strip("_")
+    return slug[:max_length] or "job"
+
+
+def export_filename(index, job, content_type):
+    role = slugify(job.get("role") if isinstance(job, dict) else job)
+    if content_type == "Cover Letter":
+        return f"{index:02d}_{role}_cover_letter.docx"
+    return f"{index:02d}_{role}_cold_email.txt"
+
+
+def write_batch_zip(fileobj, generated, render_docx):
+    """Write every generated item into a ZIP on fileobj, one entry at a time.
+
+    generated: iterable of (job, content_type, content). Cover letters are
+    rendered to DOCX straight into their archive entry, so only one python-docx
+    Document is alive at a time.
+    """
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, (job, content_type, content) in enumerate(generated, start=1):
+            filename = export_filename(index, job, content_type)
+            with archive.open(filename, "w") as entry:
+                if filename.endswith(".docx"):
+                    render_docx(content).save(entry)
+                else:
+                    entry.write(content.encode("utf-8"))
+    return fileobj
+
+
+def export_batch(generated, render_docx):
+    # The whole compressed archive is held in memory: st.download_button keeps
+    # its data as bytes in Streamlit's media file manager whatever it is given
+    buffer = BytesIO()
+    write_batch_zip(buffer, generated, render_docx)
+    return buffer.getvalue()
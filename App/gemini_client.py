@@ -1,12 +1,12 @@
-import os
 import re
 import json
+import threading
+from io import BytesIO
 from dotenv import load_dotenv
 import spacy
 from spacy import displacy
 import re
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.exceptions import OutputParserException
@@ -16,12 +16,38 @@ from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 
+from llm_router import build_llm, load_routes
+from utils import job_key
+
 load_dotenv()
 
-nlp = spacy.load("en_core_web_sm")
+# Loaded once per process on first use; the pipeline is safe to share across threads
+_nlp = None
+_docx_template = None
+_init_lock = threading.Lock()
+
+def get_nlp():
+    global _nlp
+    # Lock only until the first load; later calls skip it
+    if _nlp is None:
+        with _init_lock:
+            if _nlp is None:
+                _nlp = spacy.load("en_core_web_sm")
+    return _nlp
+
+def new_document():
+    # Copy of the default docx template kept in memory instead of re-read from disk
+    global _docx_template
+    if _docx_template is None:
+        with _init_lock:
+            if _docx_template is None:
+                buffer = BytesIO()
+                Document().save(buffer)
+                _docx_template = buffer.getvalue()
+    return Document(BytesIO(_docx_template))
 
 def extract_data_from_resume(resume_text):
-    doc = nlp(resume_text)
+    doc = get_nlp()(resume_text)
     
     name = None
     for ent in doc.ents:
@@ -55,16 +81,27 @@ def add_hyperlink(paragraph, text, url):
     hyperlink.append(new_run)
     paragraph._element.append(hyperlink)
 
-class GeminiClient:
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            google_api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0,
-            model="models/gemini-2.0-pro-exp-02-05"
-        )
+def merge_jobs(jobs):
+    # Flatten nested lists and drop duplicates by (role, normalized description hash)
+    merged = {}
+    for job in jobs:
+        if isinstance(job, list):
+            for item in merge_jobs(job):
+                merged.setdefault(job_key(item), item)
+        elif isinstance(job, dict):
+            merged.setdefault(job_key(job), job)
+    return list(merged.values())
 
-    def extract_jobs(self, cleaned_text):
-        prompt_extract = PromptTemplate.from_template(
+class GeminiClient:
+    def __init__(self, provider=None, routes=None):
+        # Per-operation model routing, see llm_router.load_routes for the config knobs.
+        routes = routes or load_routes()
+        self.extract_llm = build_llm("extract", routes, provider)
+        self.score_llm = build_llm("score", routes, provider)
+        self.llm = build_llm("prose", routes, provider)
+
+    def _extract_prompt(self):
+        return PromptTemplate.from_template(
             """
             ### SCRAPED TEXT FROM WEBSITE:
             {page_data}
@@ -75,10 +112,9 @@ class GeminiClient:
             Return JSON only.
             """
         )
-        chain_extract = prompt_extract | self.llm
-        res = chain_extract.invoke({"page_data": cleaned_text})
-        raw = res.content.strip()
 
+    def _parse_jobs(self, raw):
+        raw = raw.strip()
         raw = re.sub(r"\n?\s*\d+\s*:", "", raw)
         raw = re.sub(r",(\s*[\]}])", r"\1", raw)
         raw = raw.replace("“", "\"").replace("”", "\"")
@@ -91,6 +127,36 @@ class GeminiClient:
         except OutputParserException as e:
             raise OutputParserException(f"❌ Failed to parse JSON:\n\n{raw}\n\nError: {e}")
 
+    def extract_jobs(self, cleaned_text):
+        chain_extract = self._extract_prompt() | self.extract_llm
+        res = chain_extract.invoke({"page_data": cleaned_text})
+        return self._parse_jobs(res.content)
+
+    def extract_jobs_chunked(self, chunks, max_concurrency=4):
+        # Map: extract every chunk (see utils.split_postings) in parallel.
+        # Reduce: merge and deduplicate postings repeated across chunks.
+        chain_extract = self._extract_prompt() | self.extract_llm
+        responses = chain_extract.batch(
+            [{"page_data": chunk} for chunk in chunks],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+
+        jobs = []
+        errors = []
+        for res in responses:
+            if isinstance(res, Exception):
+                errors.append(res)
+                continue
+            try:
+                jobs.extend(self._parse_jobs(res.content))
+            except OutputParserException as e:
+                errors.append(e)
+
+        if errors and not jobs:
+            raise errors[0]
+        return merge_jobs(jobs)
+
     def write_mail(self, job_description, links):
         prompt_email = PromptTemplate.from_template(
             f"""
@@ -177,8 +243,13 @@ class GeminiClient:
         return res.content.strip()
 
     def save_cover_letter(self, content, filename="Cover_Letter.docx"):
+        doc = self.render_cover_letter(content)
+        doc.save(filename)
+        return filename
+
+    def render_cover_letter(self, content):
         name, email, phone = extract_data_from_resume(content)
-        doc = Document()
+        doc = new_document()
         
         if name:
             # Add the heading with the name
@@ -229,8 +300,7 @@ class GeminiClient:
         #doc.add_paragraph("\nSincerely,")
         #doc.add_paragraph("Pradhum Niroula")
 
-        doc.save(filename)
-        return filename
+        return doc
 
     def calculate_ats_score(self, resume_text, job_description_text):
         prompt = PromptTemplate.from_template(
@@ -258,7 +328,7 @@ class GeminiClient:
             """
         )
 
-        chain_ats = prompt | self.llm
+        chain_ats = prompt | self.score_llm
         res = chain_ats.invoke({
             "resume": resume_text,
             "job_desc": job_description_text
@@ -0,0 +1,148 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+
+from utils import job_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    url TEXT,
+    role TEXT,
+    experience TEXT,
+    skills TEXT,
+    description TEXT,
+    fetched_at REAL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    role, skills, description,
+    content='jobs', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, role, skills, description)
+    VALUES (new.id, new.role, new.skills, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, role, skills, description)
+    VALUES ('delete', old.id, old.role, old.skills, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, role, skills, description)
+    VALUES ('delete', old.id, old.role, old.skills, old.description);
+    INSERT INTO jobs_fts(rowid, role, skills, description)
+    VALUES (new.id, new.role, new.skills, new.description);
+END;
+"""
+
+
+def content_hash(job):
+    role, description_hash = job_key(job)
+    return hashlib.sha1(f"{role}\n{description_hash}".encode("utf-8")).hexdigest()
+
+
+def _fts_query(text):
+    # Quote every term so user input can't break FTS5 syntax; terms are ANDed
+    return " ".join(f'"{term}"' for term in re.findall(r"\w+", text))
+
+
+class JobStore:
+    def __init__(self, path=None):
+        self.path = path or os.getenv("JOB_STORE_PATH", "jobs.db")
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # A connection per call keeps the store safe across Streamlit script threads
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def upsert_jobs(self, url, jobs, fetched_at=None):
+        fetched_at = fetched_at or time.time()
+        rows = []
+        for job in jobs:
+            skills = job.get("skills", [])
+            if isinstance(skills, str):
+                skills = [s.strip() for s in skills.split(",") if s.strip()]
+            rows.append((
+                content_hash(job),
+                url,
+                str(job.get("role", "")),
+                str(job.get("experience", "")),
+                json.dumps(skills),
+                str(job.get("description", "")),
+                fetched_at,
+            ))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO jobs (content_hash, url, role, experience, skills, description, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(content_hash) DO UPDATE SET
+                        url = excluded.url,
+                        experience = excluded.experience,
+                        skills = excluded.skills,
+                        fetched_at = excluded.fetched_at
+                    """,
+                    rows
+                )
+        finally:
+            conn.close()
+        return len(rows)
+
+    def search(self, keywords="", skill="", limit=50):
+        """Full-text search over stored postings, best matches first."""
+        terms = []
+        if _fts_query(keywords):
+            terms.append(_fts_query(keywords))
+        if _fts_query(skill):
+            terms.append(f"skills : ({_fts_query(skill)})")
+
+        conn = self._connect()
+        try:
+            if terms:
+                rows = conn.execute(
+                    """
+                    SELECT jobs.* FROM jobs_fts
+                    JOIN jobs ON jobs.id = jobs_fts.rowid
+                    WHERE jobs_fts MATCH ?
+                    ORDER BY bm25(jobs_fts)
+                    LIMIT ?
+                    """,
+                    (" AND ".join(terms), limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs ORDER BY fetched_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+        finally:
+            conn.close()
+        return [self._to_job(row) for row in rows]
+
+    def count(self):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_job(row):
+        job = dict(row)
+        job["skills"] = json.loads(job["skills"] or "[]")
+        return job
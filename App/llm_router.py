@@ -0,0 +1,117 @@
+import os
+import json
+import re
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+# Structured extraction/scoring runs on a flash-class model; only the prose
+# (cold email, cover letter) needs the large model.
+DEFAULT_ROUTES = {
+    "extract": {"model": "models/gemini-2.0-flash", "fallbacks": ["models/gemini-2.0-flash-lite"], "timeout": 30},
+    "score": {"model": "models/gemini-2.0-flash", "fallbacks": ["models/gemini-2.0-flash-lite"], "timeout": 30},
+    "prose": {"model": "models/gemini-2.0-pro-exp-02-05", "fallbacks": ["models/gemini-2.0-flash"], "timeout": 60},
+}
+
+
+def load_routes(config_path=None):
+    """Merge DEFAULT_ROUTES with the optional JSON config file and env overrides.
+
+    Config file (GEMINI_MODEL_CONFIG, default model_config.json):
+        {"extract": {"model": "...", "fallbacks": ["..."], "timeout": 20}, ...}
+    Env overrides per operation: GEMINI_<OP>_MODEL, GEMINI_<OP>_FALLBACKS
+    (comma separated, empty to disable) and GEMINI_<OP>_TIMEOUT (seconds).
+    """
+    routes = {op: dict(route) for op, route in DEFAULT_ROUTES.items()}
+
+    config_path = config_path or os.getenv("GEMINI_MODEL_CONFIG", "model_config.json")
+    if os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            for op, route in json.load(f).items():
+                routes.setdefault(op, {}).update(route)
+
+    for op, route in routes.items():
+        prefix = f"GEMINI_{op.upper()}_"
+        if os.getenv(prefix + "MODEL"):
+            route["model"] = os.getenv(prefix + "MODEL")
+        if os.getenv(prefix + "FALLBACKS") is not None:
+            route["fallbacks"] = [m.strip() for m in os.getenv(prefix + "FALLBACKS").split(",") if m.strip()]
+        if os.getenv(prefix + "TIMEOUT"):
+            route["timeout"] = float(os.getenv(prefix + "TIMEOUT"))
+
+    return routes
+
+
+def _gemini(model, timeout, max_retries=2):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        google_api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0,
+        model=model,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
+def build_llm(operation, routes=None, provider=None):
+    routes = routes or load_routes()
+    provider = provider or os.getenv("LLM_PROVIDER", "gemini")
+
+    if provider == "stub":
+        return stub_llm(operation)
+
+    route = routes[operation]
+    timeout = route.get("timeout")
+    fallbacks = [_gemini(model, timeout) for model in route.get("fallbacks", [])]
+    if not fallbacks:
+        return _gemini(route["model"], timeout)
+
+    # Don't burn the latency budget retrying the large model; hand over to the fallback.
+    llm = _gemini(route["model"], timeout, max_retries=0)
+    return llm.with_fallbacks(fallbacks)
+
+
+# ---------------------------
+# Offline stub provider (LLM_PROVIDER=stub)
+# ---------------------------
+def _prompt_text(prompt_value):
+    if hasattr(prompt_value, "to_string"):
+        return prompt_value.to_string()
+    return str(prompt_value)
+
+
+def _stub_extract(text):
+    words = re.findall(r"[A-Za-z][A-Za-z0-9+#.]*", text.split("### INSTRUCTION:")[0].split("WEBSITE:")[-1])
+    description = " ".join(words[:80])
+    return json.dumps([{
+        "role": " ".join(words[:3]) or "Unknown Role",
+        "experience": "N/A",
+        "skills": sorted({w for w in words if w[:1].isupper()})[:10],
+        "description": description,
+    }])
+
+
+def _stub_score(text):
+    return json.dumps({
+        "ats_score": 50,
+        "matched_keywords": [],
+        "missing_keywords": [],
+        "recommendations": ["Stub provider in use; configure GOOGLE_API_KEY for real scoring."],
+    })
+
+
+def _stub_prose(text):
+    return (
+        "Dear Hiring Team,\n\n"
+        "This is placeholder content generated offline by the stub LLM provider.\n\n"
+        "Sincerely,\nApplicant"
+    )
+
+
+_STUB_RESPONSES = {"extract": _stub_extract, "score": _stub_score, "prose": _stub_prose}
+
+
+def stub_llm(operation):
+    respond = _STUB_RESPONSES[operation]
+    return RunnableLambda(lambda prompt_value: AIMessage(content=respond(_prompt_text(prompt_value))))
@@ -0,0 +1,118 @@
+import os
+import gc
+import sys
+import time
+import argparse
+import threading
+import tracemalloc
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+from content_extractor import extract_main_content
+from gemini_client import GeminiClient
+from main import parse_resume
+from uploads import spool_upload
+from utils import clean_text
+
+FIXTURE_PAGE = "resource/fixtures/job_posting_plain.html"
+SAMPLE_RESUME = (
+    "Jane Doe\njane.doe@example.com | +1 313 555 0100\n\n"
+    "Senior software engineer with 8 years of experience building Python, Django and React "
+    "applications on AWS. Led a team of five, introduced CI/CD with GitHub Actions and cut "
+    "deployment time by 70%. Strong communication, mentoring and problem solving skills.\n"
+) * 40
+
+
+def current_rss():
+    # Resident set size in bytes (Linux); falls back to the process high-water mark
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, interval=0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.peak = max(self.peak, current_rss())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.peak
+
+
+def simulate_session(llm, html, resume_bytes, barrier):
+    # One user: upload, scrape + clean, ATS score, cover letter, DOCX download
+    resume_content = parse_resume("text/plain", spool_upload(BytesIO(resume_bytes)))
+    job_description = clean_text(extract_main_content(html)[:6000])
+
+    ats_results = llm.calculate_ats_score(resume_content, job_description)
+    cover_letter = llm.write_cover_letter(resume_content, job_description, "no links")
+    cover_letter_file = BytesIO()
+    llm.render_cover_letter(cover_letter).save(cover_letter_file)
+
+    # What a session keeps between reruns; held until every session got here
+    state = (job_description, resume_content, ats_results, cover_letter, cover_letter_file.getvalue())
+    barrier.wait()
+    return state
+
+
+def run(sessions, llm, html, resume_bytes):
+    gc.collect()
+    baseline_rss = current_rss()
+    tracemalloc.reset_peak()
+    baseline_py = tracemalloc.get_traced_memory()[0]
+    sampler = RssSampler()
+    sampler.start()
+
+    barrier = threading.Barrier(sessions)
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        states = list(pool.map(lambda _: simulate_session(llm, html, resume_bytes, barrier), range(sessions)))
+
+    peak_rss = sampler.stop()
+    peak_py = tracemalloc.get_traced_memory()[1]
+    del states
+    return (peak_py - baseline_py) / sessions, (peak_rss - baseline_rss) / sessions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent sessions against the stub LLM.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--resume", help="Resume .txt to upload (default: built-in sample)")
+    parser.add_argument("--page", default=FIXTURE_PAGE, help="Saved job page HTML")
+    args = parser.parse_args(argv)
+
+    with open(args.page, "r", encoding="utf-8") as f:
+        html = f.read()
+    if args.resume:
+        with open(args.resume, "rb") as f:
+            resume_bytes = f.read()
+    else:
+        resume_bytes = SAMPLE_RESUME.encode("utf-8")
+
+    llm = GeminiClient(provider="stub")
+    # Warm up shared resources so they don't count against the first run
+    simulate_session(llm, html, resume_bytes, threading.Barrier(1))
+
+    tracemalloc.start()
+    print(f"{'sessions':>8}{'py peak/session':>18}{'rss peak/session':>19}")
+    for sessions in args.sessions:
+        py_per_session, rss_per_session = run(sessions, llm, html, resume_bytes)
+        print(f"{sessions:>8}{py_per_session / 1024:>15.0f} KB{rss_per_session / 1024:>16.0f} KB")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
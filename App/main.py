@@ -1,17 +1,22 @@
 import streamlit as st
-from langchain_community.document_loaders import WebBaseLoader
-from gemini_client import GeminiClient
+import resources
+from content_extractor import load_page_text
+from near_duplicates import PostingCache
+from uploads import UploadTooLarge, spool_upload
 from utils import clean_text
 
 import base64
+from concurrent.futures import CancelledError
+from io import BytesIO
 
-import base64
+@st.cache_resource(show_spinner=False)
+def load_background_video(video_path="static/ninja_bg.mp4"):
+    # Encoded once per process rather than on every rerun of every session
+    with open(video_path, "rb") as video_file:
+        return base64.b64encode(video_file.read()).decode()
 
 def add_custom_css():
-    video_path = "static/ninja_bg.mp4"
-    with open(video_path, "rb") as video_file:
-        video_bytes = video_file.read()
-        base64_video = base64.b64encode(video_bytes).decode()
+    base64_video = load_background_video()
 
     st.markdown(f"""
         <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@700&display=swap" rel="stylesheet">
@@ -82,15 +87,75 @@ def add_custom_css():
 
 
 
-def create_streamlit_app(llm, clean_text):
+# ---------------------------
+# Speculative prefetch: start scraping and resume parsing as soon as the inputs
+# change, so the work overlaps with the user picking a content type.
+# ---------------------------
+def fetch_job_description(url, clean_text):
+    # Only the cleaned 6000-character slice outlives the call; the full page is dropped here
+    return clean_text(load_page_text(url)[:6000])
+
+def cancel_prefetch(name):
+    # Superseded work still queued in the shared pool would delay other sessions
+    entry = st.session_state.pop(name, None)
+    if entry:
+        entry[1].cancel()
+
+def prefetch_job_page(clean_text):
+    cancel_prefetch("prefetch_page")
+    url = st.session_state.get("job_url", "").strip()
+    if url:
+        future = resources.get_executor().submit(fetch_job_description, url, clean_text)
+        st.session_state["prefetch_page"] = (url, future)
+
+def resume_key(resume_file):
+    return getattr(resume_file, "file_id", None) or (resume_file.name, resume_file.size)
+
+def prefetch_resume():
+    cancel_prefetch("prefetch_resume")
+    resume_file = st.session_state.get("resume_file")
+    if resume_file is None:
+        return
+    # Copy the upload on the script thread; only the parsing runs in the background
+    try:
+        resume_stream = spool_upload(resume_file)
+    except UploadTooLarge:
+        # Too large: Generate reports the error when it re-checks the upload
+        return
+    future = resources.get_executor().submit(parse_resume, resume_file.type, resume_stream)
+    st.session_state["prefetch_resume"] = (resume_key(resume_file), future)
+
+def prefetched(name, key, compute):
+    # Use the finished (or still running) prefetch if it matches the current
+    # input; a failed prefetch raises its error rather than repeating the same
+    # slow request. Compute synchronously only for a stale or cancelled
+    # prefetch. The entry is consumed either way so its result doesn't stay in
+    # session_state.
+    entry = st.session_state.pop(name, None)
+    if entry and entry[0] == key:
+        try:
+            return entry[1].result()
+        except CancelledError:
+            pass
+    elif entry:
+        entry[1].cancel()
+    return compute()
+
+def create_streamlit_app(llm, clean_text, cache=None):
     st.set_page_config(layout="wide", page_title="ATS Ninja", page_icon="📧")
     add_custom_css()
 
     st.title("📧 ATS Ninja: GEN-AI Powered Job Application Assistant")
 
-    url_input = st.text_input("🔗 Job Posting URL", value="")
+    url_input = st.text_input(
+        "🔗 Job Posting URL", value="", key="job_url",
+        on_change=prefetch_job_page, args=(clean_text,)
+    )
 
-    resume_file = st.file_uploader("📄 Upload Your Resume (PDF, DOCX, or TXT)", type=["pdf", "docx", "txt"])
+    resume_file = st.file_uploader(
+        "📄 Upload Your Resume (PDF, DOCX, or TXT)", type=["pdf", "docx", "txt"],
+        key="resume_file", on_change=prefetch_resume
+    )
 
     content_type = st.selectbox(
         "✍️ What do you want to generate?",
@@ -99,27 +164,33 @@ def create_streamlit_app(llm, clean_text):
 
     submit_button = st.button("🚀 Generate")
 
+    # Cross-posted copies of an already processed job reuse its results
+    cache = cache or PostingCache()
+
     if submit_button:
         try:
-            loader = WebBaseLoader([url_input])
-            raw_text = loader.load().pop().page_content
-            job_description = clean_text(raw_text[:6000])
+            url = url_input.strip()
+            job_description = prefetched(
+                "prefetch_page", url,
+                lambda: fetch_job_description(url, clean_text)
+            )
 
             resume_content = ""
             if resume_file:
-                if resume_file.type == "application/pdf":
-                    resume_content = extract_pdf_text(resume_file)
-                elif resume_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    resume_content = extract_docx_text(resume_file)
-                elif resume_file.type == "text/plain":
-                    resume_content = resume_file.read().decode("utf-8")
+                resume_content = prefetched(
+                    "prefetch_resume", resume_key(resume_file),
+                    lambda: parse_resume(resume_file.type, spool_upload(resume_file))
+                )
 
             if content_type == "ATS Analyzer":
                 if not resume_content:
                     st.error("Please upload a resume for ATS analysis.")
                     return
 
-                ats_results = llm.calculate_ats_score(resume_content, job_description)
+                ats_results = cache.get_or_compute(
+                    job_description, resume_content, "ats_score",
+                    lambda: llm.calculate_ats_score(resume_content, job_description)
+                )
 
                 st.markdown("### 📊 ATS Compatibility Analysis")
                 st.metric(label="ATS Score (%)", value=f"{ats_results['ats_score']}%")
@@ -132,7 +203,10 @@ def create_streamlit_app(llm, clean_text):
                     st.write(f"- {rec}")
 
             elif content_type == "Cold Email":
-                email_content = llm.write_mail(job_description, "no links")
+                email_content = cache.get_or_compute(
+                    job_description, "", "cold_email",
+                    lambda: llm.write_mail(job_description, "no links")
+                )
                 st.markdown("### ✉️ Generated Cold Email:")
                 st.code(email_content, language='markdown')
 
@@ -141,22 +215,38 @@ def create_streamlit_app(llm, clean_text):
                     st.error("Please upload your resume for the cover letter.")
                     return
 
-                cover_letter_content = llm.write_cover_letter(resume_content, job_description, "no links")
+                cover_letter_content = cache.get_or_compute(
+                    job_description, resume_content, "cover_letter",
+                    lambda: llm.write_cover_letter(resume_content, job_description, "no links")
+                )
                 st.markdown("### 📝 Generated Cover Letter:")
                 st.code(cover_letter_content, language='markdown')
 
-                filename = llm.save_cover_letter(cover_letter_content)
-                with open(filename, "rb") as file:
-                    st.download_button(
-                        label="📥 Download Cover Letter",
-                        data=file,
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                    )
+                # Rendered in memory per request; a shared file on disk would be
+                # overwritten by concurrent sessions
+                cover_letter_file = BytesIO()
+                llm.render_cover_letter(cover_letter_content).save(cover_letter_file)
+                st.download_button(
+                    label="📥 Download Cover Letter",
+                    data=cover_letter_file.getvalue(),
+                    file_name="Cover_Letter.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                )
 
         except Exception as e:
             st.error(f"❌ An Error Occurred: {e}")
 
+def parse_resume(file_type, resume_stream):
+    # Closing the spooled copy frees its buffer (or temp file) as soon as the text is out
+    with resume_stream:
+        if file_type == "application/pdf":
+            return extract_pdf_text(resume_stream)
+        elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+            return extract_docx_text(resume_stream)
+        elif file_type == "text/plain":
+            return resume_stream.read().decode("utf-8")
+    return ""
+
 def extract_pdf_text(pdf_file):
     from PyPDF2 import PdfReader
     reader = PdfReader(pdf_file)
@@ -168,5 +258,5 @@ def extract_docx_text(docx_file):
     return "\n".join(para.text for para in doc.paragraphs)
 
 if __name__ == "__main__":
-    chain = GeminiClient()
-    create_streamlit_app(chain, clean_text)
+    resources.warm_up()
+    create_streamlit_app(resources.get_llm(), clean_text, cache=resources.get_posting_cache())
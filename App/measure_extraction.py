@@ -0,0 +1,41 @@
+import os
+import sys
+
+from bs4 import BeautifulSoup
+
+from content_extractor import extract_main_content
+from utils import clean_text
+
+FIXTURES_DIR = "resource/fixtures"
+
+
+def count_tokens(text):
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    except ImportError:
+        return len(text) // 4  # rough estimate without tiktoken
+
+
+def measure(fixtures_dir=FIXTURES_DIR):
+    print(f"{'page':<28}{'full tokens':>12}{'main tokens':>12}{'reduction':>11}")
+    total_full = total_main = 0
+    for name in sorted(os.listdir(fixtures_dir)):
+        if not name.endswith(".html"):
+            continue
+        with open(os.path.join(fixtures_dir, name), "r", encoding="utf-8") as f:
+            html = f.read()
+
+        # Full visible page text, as WebBaseLoader returned it
+        full = count_tokens(clean_text(BeautifulSoup(html, "html.parser").get_text()))
+        main = count_tokens(clean_text(extract_main_content(html)))
+        total_full += full
+        total_main += main
+        print(f"{name:<28}{full:>12}{main:>12}{1 - main / full:>10.0%}")
+
+    if total_full:
+        print(f"{'TOTAL':<28}{total_full:>12}{total_main:>12}{1 - total_main / total_full:>10.0%}")
+
+
+if __name__ == "__main__":
+    measure(sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR)
@@ -0,0 +1,29 @@
+import time
+
+import resources
+from gemini_client import GeminiClient
+from near_duplicates import PostingCache
+
+RERUNS = 20
+
+
+def per_rerun_ms(setup, reruns=RERUNS):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        setup()
+    return (time.perf_counter() - start) * 1000 / reruns
+
+
+def measure():
+    # Before: main.py built a fresh client (and the app its caches) on every rerun
+    before = per_rerun_ms(lambda: (GeminiClient(), PostingCache()))
+
+    # Prime only what is measured; warm_up() also needs the spaCy model
+    resources.get_llm(), resources.get_posting_cache()
+    after = per_rerun_ms(lambda: (resources.get_llm(), resources.get_posting_cache()))
+
+    print(f"Per-rerun resource setup: before {before:.2f} ms, after {after:.3f} ms")
+
+
+if __name__ == "__main__":
+    measure()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+from skills import SkillGazetteer, DEFAULT_TAXONOMY
+
+# Resume-style sentences written independently of the taxonomy: mixed casing,
+# lowercase skill lists, names the taxonomy doesn't know and plain prose
+SENTENCES = [
+    "Senior software engineer with {n} years of experience building python and django services on aws.",
+    "Skills: python, sql, aws, git, css, php, gcp, vue, docker, k8s, terraform.",
+    "Led a team of {n} engineers migrating a monolith to microservices on Kubernetes with Helm and Argo CD.",
+    "Built ETL pipelines in PySpark and dbt, loading Snowflake and BigQuery for finance dashboards in Looker.",
+    "Registered nurse with ACLS, BLS and PALS certification; charted in Epic and Cerner across {n} units.",
+    "Administered medications, IV therapy and wound care for {n} patients per shift on a med-surg floor.",
+    "Staff accountant handling month-end close, account reconciliations and accounts payable in NetSuite.",
+    "Prepared financial statements under US GAAP and supported the external audit and SOX testing.",
+    "Account executive closing ${n}k ARR with consultative selling, Salesforce and Gong; 120% of quota.",
+    "Ran paid social and google ads campaigns, improving conversion rate by {n}% with A/B testing.",
+    "Managed a warehouse of {n} staff: forklift operation, cycle counting, pick and pack, OSHA compliance.",
+    "Mechanical engineer designing sheet metal enclosures in SolidWorks with GD&T and FEA in ANSYS.",
+    "Maintained CNC machining centers, wrote G-code in Mastercam and ran first article inspection.",
+    "Taught algebra and geometry to {n} students, wrote lesson plans and used Google Classroom.",
+    "Restaurant manager responsible for food safety (ServSafe), scheduling, inventory and a ${n}k budget.",
+    "Recruiter running full-cycle recruiting in Greenhouse with boolean search on LinkedIn Recruiter.",
+    "Security analyst triaging SIEM alerts in Splunk, threat hunting with CrowdStrike and writing runbooks.",
+    "Network engineer configuring BGP, OSPF and VLANs on Cisco and Juniper gear; CCNP certified.",
+    "Designed mobile apps in Figma, ran usability testing and handed off design tokens to iOS and Android.",
+    "Research assistant performing PCR, western blot and cell culture; analysed data in R and GraphPad.",
+    "Fluent in English, Spanish and Mandarin; volunteer tutor at the local library on weekends.",
+    "References available on request. Hobbies include hiking, chess, woodworking and amateur astronomy.",
+    "Improved p95 latency from {n}ms to 40ms by adding redis caching and tuning postgres indexes.",
+    "Worked closely with product, design and operations stakeholders to plan quarterly roadmaps.",
+    "Education: B.S. in Computer Science, GPA 3.{n}; coursework in algorithms, operating systems and compilers.",
+    "Drove a box truck with a class A CDL and kept delivery logs for {n} routes across the county.",
+    "Supported {n} end users with help desk tickets in ServiceNow, Active Directory and Intune.",
+    "Owned the quarterly forecast in Anaplan and built variance analysis for the CFO staff meeting.",
+]
+
+
+def synthetic_resumes(count, sentences_per_resume=30, seed=7):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(SENTENCES).format(n=rng.randint(2, 99)) for _ in range(sentences_per_resume))
+        for _ in range(count)
+    ]
+
+
+def load_corpus(directory):
+    # One resume per .txt file, e.g. an exported resume dataset
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".txt"):
+            with open(os.path.join(directory, name), "r", encoding="utf-8", errors="ignore") as f:
+                corpus.append(f.read())
+    return corpus
+
+
+def measure(corpus, taxonomy=DEFAULT_TAXONOMY):
+    start = time.perf_counter()
+    gazetteer = SkillGazetteer.from_csv(taxonomy)
+    build = time.perf_counter() - start
+
+    size_mb = sum(len(text) for text in corpus) / 1e6
+
+    start = time.perf_counter()
+    found = sum(len(gazetteer.extract(text)) for text in corpus)
+    elapsed = time.perf_counter() - start
+
+    print(f"Taxonomy: {gazetteer.size} skill names/aliases, automaton built in {build * 1000:.0f} ms")
+    print(f"Corpus: {len(corpus)} resumes, {size_mb:.1f} MB, {found} skills extracted")
+    print(f"Throughput: {size_mb / elapsed:.2f} MB/s, {len(corpus) / elapsed:.0f} resumes/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction over a resume corpus.")
+    parser.add_argument("--corpus", help="Directory of resume .txt files (default: synthetic corpus)")
+    parser.add_argument("--count", type=int, default=5000, help="Synthetic resumes to generate")
+    parser.add_argument("--taxonomy", default=DEFAULT_TAXONOMY)
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_resumes(args.count)
+    measure(corpus, args.taxonomy)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
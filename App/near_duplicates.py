@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 32  # 32 bands x 4 rows: candidates from ~0.4 Jaccard, verified against the threshold
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+MERSENNE_PRIME = (1 << 31) - 1
+# Postings shorter than this have too few shingles to fingerprint; placeholders
+# like "No description found" would otherwise all match each other
+MIN_WORDS = 30
+
+# Bounds on the table and the in-memory index: least recently used entries
+# beyond MAX_ENTRIES and entries older than TTL_DAYS are dropped
+MAX_ENTRIES = int(os.getenv("POSTING_CACHE_MAX_ENTRIES", "5000"))
+TTL_DAYS = float(os.getenv("POSTING_CACHE_TTL_DAYS", "30"))
+
+_rng = np.random.RandomState(42)
+_A = _rng.randint(1, MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_postings (
+    id INTEGER PRIMARY KEY,
+    resume_hash TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    outputs TEXT NOT NULL,
+    created_at REAL
+);
+"""
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    words = text.lower().split()
+    if len(words) < k:
+        words = words + [""] * (k - len(words))
+    return {zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)}
+
+
+def minhash(text):
+    x = np.fromiter(shingles(text), dtype=np.uint64)
+    # (a * x + b) mod p for every permutation and shingle, min over shingles
+    hashes = (np.outer(_A, x & MERSENNE_PRIME) + _B[:, None]) % MERSENNE_PRIME
+    return hashes.min(axis=1)
+
+
+def estimate_jaccard(signature, other):
+    return float(np.mean(signature == other))
+
+
+def _bands(signature):
+    return [(band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+
+def cacheable(posting_text):
+    return len((posting_text or "").split()) >= MIN_WORDS
+
+
+def resume_hash(resume_text):
+    return hashlib.sha1((resume_text or "").encode("utf-8")).hexdigest()
+
+
+class PostingCache:
+    """Reuses LLM outputs for postings that near-duplicate one already processed
+    for the same resume (cross-posted jobs with slightly different wording)."""
+
+    def __init__(self, path=None, threshold=0.8, max_entries=MAX_ENTRIES, ttl_days=TTL_DAYS):
+        self.path = path or os.getenv("JOB_STORE_PATH", "jobs.db")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # least recently used first
+        self._buckets = {}
+
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.execute("DELETE FROM processed_postings WHERE created_at < ?", (time.time() - self.ttl,))
+                conn.execute(
+                    "DELETE FROM processed_postings WHERE id NOT IN "
+                    "(SELECT id FROM processed_postings ORDER BY created_at DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+            rows = conn.execute(
+                "SELECT id, resume_hash, signature, outputs, created_at FROM processed_postings ORDER BY created_at"
+            ).fetchall()
+        finally:
+            conn.close()
+        for entry_id, entry_resume_hash, signature, outputs, created_at in rows:
+            self._index(
+                entry_id, entry_resume_hash, np.frombuffer(signature, dtype=np.uint64), json.loads(outputs), created_at
+            )
+
+    def _index(self, entry_id, entry_resume_hash, signature, outputs, created_at):
+        self._entries[entry_id] = (entry_resume_hash, signature, outputs, created_at)
+        for key in _bands(signature):
+            self._buckets.setdefault((entry_resume_hash,) + key, set()).add(entry_id)
+
+    def _unindex(self, entry_id):
+        entry_resume_hash, signature, _, _ = self._entries.pop(entry_id)
+        for key in _bands(signature):
+            bucket_key = (entry_resume_hash,) + key
+            bucket = self._buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[bucket_key]
+
+    def _evict(self, conn):
+        expired_before = time.time() - self.ttl
+        evicted = [entry_id for entry_id, entry in self._entries.items() if entry[3] < expired_before]
+        overflow = len(self._entries) - len(evicted) - self.max_entries
+        if overflow > 0:
+            expired = set(evicted)
+            evicted += [entry_id for entry_id in self._entries if entry_id not in expired][:overflow]
+        for entry_id in evicted:
+            self._unindex(entry_id)
+        conn.executemany("DELETE FROM processed_postings WHERE id = ?", [(entry_id,) for entry_id in evicted])
+
+    def _find(self, signature, entry_resume_hash):
+        candidates = set()
+        for key in _bands(signature):
+            candidates |= self._buckets.get((entry_resume_hash,) + key, set())
+
+        best_id, best_similarity = None, self.threshold
+        expired_before = time.time() - self.ttl
+        for entry_id in candidates:
+            if self._entries[entry_id][3] < expired_before:
+                continue
+            similarity = estimate_jaccard(signature, self._entries[entry_id][1])
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+        return best_id
+
+    def lookup(self, posting_text, resume_text, operation):
+        if not cacheable(posting_text):
+            return None
+        signature = minhash(posting_text)
+        with self._lock:
+            entry_id = self._find(signature, resume_hash(resume_text))
+            if entry_id is None:
+                return None
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][2].get(operation)
+
+    def store(self, posting_text, resume_text, operation, result):
+        if not cacheable(posting_text):
+            return
+        signature = minhash(posting_text)
+        entry_resume_hash = resume_hash(resume_text)
+        with self._lock:
+            conn = sqlite3.connect(self.path, timeout=10)
+            try:
+                with conn:
+                    entry_id = self._find(signature, entry_resume_hash)
+                    if entry_id is not None:
+                        self._entries.move_to_end(entry_id)
+                        outputs = self._entries[entry_id][2]
+                        outputs[operation] = result
+                        conn.execute(
+                            "UPDATE processed_postings SET outputs = ? WHERE id = ?",
+                            (json.dumps(outputs), entry_id)
+                        )
+                    else:
+                        outputs = {operation: result}
+                        created_at = time.time()
+                        entry_id = conn.execute(
+                            "INSERT INTO processed_postings (resume_hash, signature, outputs, created_at) VALUES (?, ?, ?, ?)",
+                            (entry_resume_hash, signature.tobytes(), json.dumps(outputs), created_at)
+                        ).lastrowid
+                        self._index(entry_id, entry_resume_hash, signature, outputs, created_at)
+                        self._evict(conn)
+            finally:
+                conn.close()
+
+    def get_or_compute(self, posting_text, resume_text, operation, compute):
+        cached = self.lookup(posting_text, resume_text, operation)
+        if cached is not None:
+            return cached
+        result = compute()
+        self.store(posting_text, resume_text, operation, result)
+        return result
@@ -3,9 +3,20 @@ import pandas as pd
 import chromadb
 import uuid
 
+from ranking import get_embedding_function
+from skills import get_skill_gazetteer
+
+# Resolved against this file so every worker opens the same store regardless of cwd
+VECTORSTORE_PATH = os.getenv(
+    "PORTFOLIO_VECTORSTORE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "vectorstore")
+)
+
 class Portfolio:
-    def __init__(self, file_path="resource/my_portfolio.csv"):
+    def __init__(self, file_path="resource/my_portfolio.csv", index=None):
         self.file_path = file_path
+        # Optional SnapshotReader; when a snapshot is published, queries read it
+        # instead of opening the Chroma store in this process
+        self.index = index
 
         if not os.path.exists(file_path):
             raise FileNotFoundError(
@@ -17,8 +28,23 @@ class Portfolio:
         print(f"Loading portfolio data from: {file_path}")
         self.data = pd.read_csv(file_path)
 
-        self.chroma_client = chromadb.PersistentClient(path="vectorstore")
-        self.collection = self.chroma_client.get_or_create_collection(name="portfolio")
+        self.embedding_function = get_embedding_function()
+        self._collection = None
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            chroma_client = chromadb.PersistentClient(path=VECTORSTORE_PATH)
+            self._collection = chroma_client.get_or_create_collection(
+                name="portfolio", embedding_function=self.embedding_function
+            )
+        return self._collection
+
+    def has_snapshot(self):
+        if self.index is None:
+            return False
+        with self.index.current() as snapshot:
+            return snapshot is not None
 
     def load_portfolio(self):
         current_count = self.collection.count()
@@ -41,15 +67,20 @@ class Portfolio:
             skills += relevant_skills
 
         print(f"Querying links for skills: {skills}")
+        if self.index is not None:
+            with self.index.current() as snapshot:
+                if snapshot is not None:
+                    return snapshot.query_links(skills, embedding_function=self.embedding_function)
+
         results = self.collection.query(query_texts=skills, n_results=2)
 
         if not results.get("metadatas"):
             print("No metadata returned. Make sure the collection is loaded correctly.")
             return []
 
-        return [item["links"] for item in results["metadatas"]]
+        return [[item["links"] for item in items] for items in results["metadatas"]]
 
     def extract_relevant_skills(self, resume_content):
-        # Placeholder for actual NLP logic
+        # Canonical skills from the taxonomy in resource/skills.csv
         print("Extracting relevant skills from resume content...")
-        return ["skill_from_resume"]
+        return get_skill_gazetteer().extract(resume_content)
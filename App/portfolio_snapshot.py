@@ -0,0 +1,200 @@
+import os
+import json
+import mmap
+import time
+import struct
+import hashlib
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+# Immutable, versioned snapshot of the portfolio collection that worker
+# processes map read-only, so N workers share one page-cache copy instead of
+# each opening the Chroma store.
+#
+# Layout: header | float32 embeddings (L2-normalised, count x dim) | metadata JSON
+MAGIC = b"PFSNAP1\0"
+HEADER = struct.Struct("<8sIIQQ")  # magic, count, dim, metadata offset, metadata length
+DATA_OFFSET = 64
+CURRENT = "CURRENT"
+KEEP_SNAPSHOTS = 3
+
+SNAPSHOT_DIR = os.getenv(
+    "PORTFOLIO_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+)
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(directory, ids, embeddings, documents, metadatas):
+    """Write a new snapshot file and atomically make it the current one."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim != 2:
+        embeddings = embeddings.reshape(len(ids), -1) if len(ids) else np.zeros((0, 0), dtype=np.float32)
+    embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12)
+    count, dim = embeddings.shape
+
+    meta = json.dumps({"ids": list(ids), "documents": list(documents), "metadatas": list(metadatas)}).encode("utf-8")
+    meta_offset = DATA_OFFSET + embeddings.nbytes
+    header = HEADER.pack(MAGIC, count, dim, meta_offset, len(meta)).ljust(DATA_OFFSET, b"\0")
+    payload = header + embeddings.tobytes() + meta
+
+    version = time.strftime("%Y%m%d%H%M%S") + "-" + hashlib.sha1(payload).hexdigest()[:8]
+    filename = f"portfolio-{version}.snap"
+
+    os.makedirs(directory, exist_ok=True)
+    _atomic_write(os.path.join(directory, filename), payload)
+    # Publishing is a single rename of the pointer file; readers see old or new, never partial
+    _atomic_write(os.path.join(directory, CURRENT), filename.encode("utf-8"))
+    _prune(directory, keep=filename)
+    return filename
+
+
+def _prune(directory, keep):
+    # Workers still mapping an unlinked snapshot keep reading it until they swap.
+    # Windows refuses to delete a mapped file; it is retried on the next publish.
+    snapshots = sorted(name for name in os.listdir(directory) if name.startswith("portfolio-") and name.endswith(".snap"))
+    for name in snapshots[:-KEEP_SNAPSHOTS]:
+        if name != keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError as e:
+                print(f"Could not remove old snapshot {name}: {e}")
+
+
+def export_snapshot(portfolio, directory=SNAPSHOT_DIR):
+    data = portfolio.collection.get(include=["embeddings", "documents", "metadatas"])
+    return write_snapshot(directory, data["ids"], data["embeddings"], data["documents"], data["metadatas"])
+
+
+class PortfolioSnapshot:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._users = 0
+        self._retired = False
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, dim, meta_offset, meta_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a portfolio snapshot: {path}")
+
+        # Zero-copy, read-only view onto the shared pages
+        self.embeddings = np.frombuffer(
+            self._mmap, dtype=np.float32, count=count * dim, offset=DATA_OFFSET
+        ).reshape(count, dim)
+        meta = json.loads(self._mmap[meta_offset:meta_offset + meta_length])
+        self.ids = meta["ids"]
+        self.documents = meta["documents"]
+        self.metadatas = meta["metadatas"]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def acquire(self):
+        with self._lock:
+            self._users += 1
+
+    def release(self):
+        with self._lock:
+            self._users -= 1
+            if self._retired and not self._users:
+                self._close()
+
+    def close(self):
+        # Unmaps now, or when the last in-flight query releases it
+        with self._lock:
+            self._retired = True
+            if not self._users:
+                self._close()
+
+    def _close(self):
+        if self._mmap is not None:
+            # The numpy view must go first; mmap refuses to close while it is exported
+            self.embeddings = None
+            self._mmap.close()
+            self._mmap = None
+
+    def query(self, query_embeddings, n_results=2):
+        """Top-n metadatas per query embedding by cosine similarity."""
+        if not len(self):
+            return [[] for _ in query_embeddings]
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        queries = queries / (np.linalg.norm(queries, axis=1, keepdims=True) + 1e-12)
+        scores = queries @ self.embeddings.T
+
+        n_results = min(n_results, len(self))
+        results = []
+        for row in scores:
+            top = np.argpartition(-row, n_results - 1)[:n_results]
+            top = top[np.argsort(-row[top])]
+            results.append([self.metadatas[i] for i in top])
+        return results
+
+    def query_links(self, skills, n_results=2, embedding_function=None):
+        if not skills:
+            return []
+        if embedding_function is None:
+            from ranking import get_embedding_function
+            embedding_function = get_embedding_function()
+        return [[item["links"] for item in items] for items in self.query(embedding_function(skills), n_results)]
+
+
+class SnapshotReader:
+    """Serves the current snapshot, hot-swapping when a new one is published."""
+
+    def __init__(self, directory=SNAPSHOT_DIR, check_interval=5.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._filename = None
+        self._snapshot = None
+        self._checked_at = 0.0
+
+    @contextmanager
+    def current(self):
+        """Yield the current snapshot (or None), kept open until the block exits."""
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval:
+                self._checked_at = time.monotonic()
+                self._refresh()
+            snapshot = self._snapshot
+            if snapshot is not None:
+                snapshot.acquire()
+        try:
+            yield snapshot
+        finally:
+            if snapshot is not None:
+                snapshot.release()
+
+    def _refresh(self):
+        try:
+            with open(os.path.join(self.directory, CURRENT), "r", encoding="utf-8") as f:
+                filename = f.read().strip()
+        except FileNotFoundError:
+            return
+        if filename and filename != self._filename:
+            # Queries already holding the old snapshot finish on it before it is unmapped
+            previous = self._snapshot
+            self._snapshot = PortfolioSnapshot(os.path.join(self.directory, filename))
+            self._filename = filename
+            if previous is not None:
+                previous.close()
+
+
+if __name__ == "__main__":
+    from portfolio import Portfolio
+
+    portfolio = Portfolio()
+    portfolio.load_portfolio()
+    print(f"Published {export_snapshot(portfolio)} to {SNAPSHOT_DIR}")
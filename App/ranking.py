@@ -0,0 +1,36 @@
+import numpy as np
+
+_embedding_function = None
+
+
+def get_embedding_function():
+    # Chroma's default (all-MiniLM-L6-v2, ONNX) model, shared with Portfolio
+    global _embedding_function
+    if _embedding_function is None:
+        from chromadb.utils import embedding_functions
+        _embedding_function = embedding_functions.DefaultEmbeddingFunction()
+    return _embedding_function
+
+
+def job_text(job):
+    skills = job.get("skills", "")
+    if isinstance(skills, list):
+        skills = ", ".join(str(s) for s in skills)
+    return f"{job.get('role', '')}\nSkills: {skills}\n{job.get('description', '')}"
+
+
+def rank_jobs(resume_text, jobs, top_k=None, embedding_function=None):
+    """Return [(score, job), ...] sorted by cosine similarity to the resume."""
+    if not jobs:
+        return []
+
+    embedding_function = embedding_function or get_embedding_function()
+    # One batch for the resume and every job, one matrix product for the scores
+    vectors = np.asarray(embedding_function([resume_text] + [job_text(job) for job in jobs]), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    scores = vectors[1:] @ vectors[0]
+
+    order = np.argsort(-scores)
+    if top_k:
+        order = order[:top_k]
+    return [(float(scores[i]), jobs[i]) for i in order]
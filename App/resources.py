@@ -0,0 +1,91 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from gemini_client import GeminiClient, get_nlp, new_document
+from job_store import JobStore
+from near_duplicates import PostingCache
+from ranking import get_embedding_function
+from skills import get_skill_gazetteer
+
+# Process-wide resources. Streamlit re-executes the app script on every
+# interaction; st.cache_resource builds each of these once per server process
+# (creation is locked, so concurrent sessions never build a second copy) and
+# hands the same instance to every rerun and session.
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm():
+    return GeminiClient()
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_store():
+    return JobStore()
+
+
+@st.cache_resource(show_spinner=False)
+def get_posting_cache():
+    return PostingCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_portfolio():
+    from portfolio import Portfolio
+    portfolio = Portfolio(index=get_portfolio_index())
+    # With a published snapshot the Chroma store is never opened in this process
+    if not portfolio.has_snapshot():
+        portfolio.load_portfolio()
+    return portfolio
+
+
+@st.cache_resource(show_spinner=False)
+def get_portfolio_index():
+    # Read-only view of the published snapshot (python portfolio_snapshot.py);
+    # "with index.current() as snapshot" per query picks up hot-swapped snapshots
+    from portfolio_snapshot import SnapshotReader
+    return SnapshotReader()
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    # Background pool for speculative prefetch (page scraping, resume parsing)
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="prefetch")
+
+
+def warm_up_embeddings():
+    # Loading the ONNX model downloads it on first use, which the offline stub mode can't do
+    default = "0" if os.getenv("LLM_PROVIDER") == "stub" else "1"
+    return os.getenv("WARM_UP_EMBEDDINGS", default) == "1"
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up():
+    """Initialise every shared resource; runs on the first script run of the process."""
+    steps = [
+        ("llm", get_llm),
+        ("spacy", lambda: get_nlp()("warm up")),
+        ("docx_template", new_document),
+        ("job_store", get_job_store),
+        ("posting_cache", get_posting_cache),
+        ("skills", get_skill_gazetteer),
+    ]
+    if warm_up_embeddings():
+        steps.append(("embeddings", lambda: get_embedding_function()(["warm up"])))
+
+    timings = {}
+    for name, init in steps:
+        start = time.perf_counter()
+        try:
+            init()
+        except Exception as e:
+            if name != "embeddings":
+                raise
+            # Optional: ranking loads the model on first use instead
+            print(f"Skipped embeddings warm-up: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+    print(f"Resources ready: {', '.join(f'{k}={v * 1000:.0f}ms' for k, v in timings.items())}")
+    return timings
@@ -0,0 +1,128 @@
+import re
+import csv
+import threading
+from collections import deque
+
+DEFAULT_TAXONOMY = "resource/skills.csv"
+
+
+def _match_case(value):
+    # MatchCase column: "yes" for every single-word name, or "|"-separated names
+    if value.strip().lower() == "yes":
+        return True
+    return {name for name in value.split("|") if name}
+
+
+class SkillGazetteer:
+    """Aho-Corasick automaton over a skill taxonomy (canonical names + aliases).
+
+    extract() finds every canonical skill mentioned in a text in one linear
+    scan, whatever the number of skills in the taxonomy.
+    """
+
+    def __init__(self, entries):
+        # entries: iterable of (canonical, [aliases], match_case); match_case is
+        # True for every single-word name of the skill, or the set of names that
+        # only count with the taxonomy's casing ("Go" but not "Golang")
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self.size = 0
+        for canonical, aliases, match_case in entries:
+            for alias in [canonical] + list(aliases):
+                alias = " ".join(alias.split())
+                if not alias:
+                    continue
+                # Names that are also common words ("Go", "CV", "Spring") only
+                # count when written with the taxonomy's casing
+                if match_case is True:
+                    exact = alias if " " not in alias else None
+                else:
+                    exact = alias if alias in match_case else None
+                self._add(alias.lower(), (len(alias), canonical, exact))
+                self.size += 1
+        self._build_failure_links()
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_TAXONOMY):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            entries = [
+                (row["Skill"], [a for a in (row.get("Aliases") or "").split("|") if a],
+                 _match_case(row.get("MatchCase") or ""))
+                for row in csv.DictReader(f)
+            ]
+        return cls(entries)
+
+    def _add(self, pattern, output):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(output)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _matches(self, text):
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(lowered):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, canonical, exact in out[node]:
+                start = i - length + 1
+                # Whole words only: "Java" must not match inside "JavaScript"
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if i + 1 < len(text) and text[i + 1].isalnum():
+                    continue
+                if exact and text[start:i + 1] != exact:
+                    continue
+                yield start, i + 1, canonical
+
+    def extract(self, text):
+        """Canonical skills in order of first mention; longest match wins on overlap."""
+        text = re.sub(r"\s+", " ", text or "")
+        skills = []
+        seen = set()
+        last_end = 0
+        for start, end, canonical in sorted(self._matches(text), key=lambda m: (m[0], m[0] - m[1])):
+            if start < last_end:
+                continue
+            last_end = end
+            if canonical not in seen:
+                seen.add(canonical)
+                skills.append(canonical)
+        return skills
+
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_skill_gazetteer(path=DEFAULT_TAXONOMY):
+    global _gazetteer
+    with _gazetteer_lock:
+        if _gazetteer is None:
+            _gazetteer = SkillGazetteer.from_csv(path)
+    return _gazetteer
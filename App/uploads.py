@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+
+import streamlit as st
+
+# server.maxUploadSize (.streamlit/config.toml) is the single source: Streamlit
+# rejects larger files before they reach the app, and spool_upload re-checks.
+MAX_UPLOAD_MB = st.get_option("server.maxUploadSize")
+MAX_UPLOAD_BYTES = MAX_UPLOAD_MB * 1024 * 1024
+
+# Uploads larger than this are parsed from a temp file on disk, not from memory
+SPOOL_MAX_BYTES = 512 * 1024
+CHUNK_BYTES = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+def upload_size(upload):
+    size = getattr(upload, "size", None)
+    if size is None:
+        upload.seek(0, os.SEEK_END)
+        size = upload.tell()
+    return size
+
+
+def spool_upload(upload, max_bytes=MAX_UPLOAD_BYTES):
+    """Copy an upload in chunks into a SpooledTemporaryFile, enforcing max_bytes."""
+    size = upload_size(upload)
+    if size > max_bytes:
+        raise UploadTooLarge(
+            f"Resume is {size / (1024 * 1024):.1f} MB; the limit is {max_bytes / (1024 * 1024):.0f} MB."
+        )
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    upload.seek(0)
+    shutil.copyfileobj(upload, spool, CHUNK_BYTES)
+    spool.seek(0)
+    return spool
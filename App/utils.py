@@ -1,4 +1,5 @@
 import re
+import hashlib
 
 def clean_text(text):
     # Remove HTML tags
@@ -13,4 +14,67 @@ def clean_text(text):
     text = text.strip()
     # Remove extra whitespace
     text = ' '.join(text.split())
-    return text
\ No newline at end of file
+    return text
+
+
+# Lines that typically open a new posting on a careers page
+POSTING_BOUNDARY = re.compile(
+    r'^\s*(job\s*(id|title|posting)|req(uisition)?\s*(id|no)?|position|role|title)\s*[:#]',
+    re.IGNORECASE
+)
+
+def _split_block(block, max_chars):
+    # Last resort for a single block longer than max_chars: cut at whitespace
+    pieces = []
+    while len(block) > max_chars:
+        cut = max(block.rfind(" ", 0, max_chars + 1), block.rfind("\n", 0, max_chars + 1))
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(block[:cut].rstrip())
+        block = block[cut:].lstrip()
+    if block:
+        pieces.append(block)
+    return pieces
+
+def split_postings(text, max_chars=6000):
+    # Split the raw page text (before clean_text, newlines still intact) into
+    # chunks of at most max_chars, covering the whole page; the number of
+    # parallel LLM calls is bounded by extract_jobs_chunked. Chunks break between postings
+    # where labelled boundaries exist, otherwise between blank-line blocks; only
+    # a single block longer than max_chars is split, and then at a word boundary.
+    postings = []
+    current = []
+    for block in re.split(r'\n\s*\n', text):
+        block = block.strip()
+        if not block:
+            continue
+        if current and POSTING_BOUNDARY.match(block):
+            postings.append(current)
+            current = []
+        current.append(block)
+    if current:
+        postings.append(current)
+
+    chunks = []
+    chunk = ""
+    for blocks in postings:
+        posting = "\n".join(blocks)
+        if len(posting) <= max_chars:
+            units = [posting]
+        else:
+            units = [piece for block in blocks for piece in _split_block(block, max_chars)]
+        for unit in units:
+            if chunk and len(chunk) + len(unit) + 2 > max_chars:
+                chunks.append(chunk)
+                chunk = ""
+            chunk = f"{chunk}\n\n{unit}" if chunk else unit
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def job_key(job):
+    # Identity of an extracted job: (role, hash of the normalized description)
+    role = " ".join(str(job.get("role", "")).lower().split())
+    description = " ".join(re.findall(r"[a-z0-9]+", str(job.get("description", "")).lower()))
+    return role, hashlib.sha1(description.encode("utf-8")).hexdigest()